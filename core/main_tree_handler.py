@@ -185,7 +185,7 @@ class NodesUpdater:
     def finish_task(cls):
         try:
             gc.enable()
-            debug(f'Global update - {int((time() - cls._start_time) * 1000)}ms')
+            debug('Global update - %sms', int((time() - cls._start_time) * 1000))
             cls._report_progress()
         finally:
             cls._event, cls._handler, cls._node_tree_area, cls._last_node, cls._start_time = [None] * 5
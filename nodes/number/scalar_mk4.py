@@ -98,9 +98,8 @@ func_dict = {
 }
 
 reversed_draw_labels = {"+1", "-1", "*2", "/2"}
-
-def func_from_mode(mode):
-    return func_dict[mode][1]
+# these functions work only with single numbers and can't be evaluated by NumPy
+non_numpy_ops = {"GCD", "ROUND-N"}
 
 def generate_node_items():
     prefilter = {k: v for k, v in func_dict.items() if not k.startswith('---')}
@@ -108,6 +107,19 @@ def generate_node_items():
 
 mode_items = generate_node_items()
 
+def generate_mode_info():
+    """Returns table: mode -> (function, number of inputs, number of outputs)"""
+    mode_info = dict()
+    for mode, info in func_dict.items():
+        if mode.startswith('---'):
+            continue
+        _, func, socket_info, _ = info
+        t_inputs, t_outputs = socket_info.split(' ')
+        mode_info[mode] = (func, len(t_inputs), len(t_outputs))
+    return mode_info
+
+mode_info = generate_mode_info()
+
 
 def property_change(node, context, origin):
     if origin == 'input_mode_one':
@@ -207,7 +219,7 @@ class SvScalarMathNodeMK4(bpy.types.Node, SverchCustomTreeNode):
         layout.row().prop(self, 'input_mode_one', text="input 1")
         if len(self.inputs) == 2:
             layout.row().prop(self, 'input_mode_two', text="input 2")
-        if self.current_op not in ['GCD', 'ROUND-N']:
+        if self.current_op not in non_numpy_ops:
             layout.row().prop(self, 'list_match', expand=False)
             layout.prop(self, "output_numpy", expand=False)
 
@@ -216,7 +228,7 @@ class SvScalarMathNodeMK4(bpy.types.Node, SverchCustomTreeNode):
         layout.prop_menu_enum(self, "input_mode_one", text="Input 1 number type")
         if len(self.inputs) == 2:
             layout.prop_menu_enum(self, "input_mode_two", text="Input 2 number type")
-        if self.current_op not in ['GCD', 'ROUND-N']:
+        if self.current_op not in non_numpy_ops:
             layout.prop_menu_enum(self, "list_match", text="List Match")
             layout.prop(self, "output_numpy", expand=False)
 
@@ -230,20 +242,19 @@ class SvScalarMathNodeMK4(bpy.types.Node, SverchCustomTreeNode):
 
 
     def update_sockets(self):
-        socket_info = func_dict.get(self.current_op)[2]
-        t_inputs, t_outputs = socket_info.split(' ')
+        _, num_inputs, num_outputs = mode_info[self.current_op]
 
-        if len(t_inputs) > len(self.inputs):
+        if num_inputs > len(self.inputs):
             new_second_input = self.inputs.new('SvStringsSocket', "y").prop_name = 'y_'
             if self.input_mode_two == 'Int':
                 new_second_input.prop_name = 'yi_'
-        elif len(t_inputs) < len(self.inputs):
+        elif num_inputs < len(self.inputs):
             self.input_mode_two = 'Float'
             self.inputs.remove(self.inputs[-1])
 
-        if len(t_outputs) > len(self.outputs):
+        if num_outputs > len(self.outputs):
             self.outputs.new('SvStringsSocket', "cos( x )")
-        elif len(t_outputs) < len(self.outputs):
+        elif num_outputs < len(self.outputs):
             self.outputs.remove(self.outputs[-1])
 
         if len(self.outputs) == 1:
@@ -257,12 +268,12 @@ class SvScalarMathNodeMK4(bpy.types.Node, SverchCustomTreeNode):
         self.ensure_enums_have_no_space(enums=["current_op"])
 
         if self.outputs[0].is_linked:
-            current_func = func_from_mode(self.current_op)
+            current_func, _, _ = mode_info[self.current_op]
             params = [si.sv_get(default=[[]], deepcopy=False) for si in self.inputs]
             matching_f = list_match_func[self.list_match]
             desired_levels = [2 for p in params]
 
-            if self.current_op in ['GCD', 'ROUND-N']:
+            if self.current_op in non_numpy_ops:
                 result = recurse_fxy(params[0], params[1], current_func)
             elif self.current_op  == 'SINCOS':
                 ops = [np.sin, self.list_match, self.output_numpy]
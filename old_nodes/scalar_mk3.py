@@ -17,6 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 from math import *
+import operator
 
 import bpy
 from bpy.props import EnumProperty, FloatProperty, IntProperty, BoolProperty
@@ -26,6 +27,7 @@ from sverchok.node_tree import SverchCustomTreeNode
 from sverchok.data_structure import updateNode
 from sverchok.utils.sv_itertools import (recurse_fx, recurse_fxy)
 from sverchok.utils.math import gcd
+import numpy as np
 # pylint: disable=C0326
 
 # Rules for modification:
@@ -34,20 +36,20 @@ from sverchok.utils.math import gcd
 
 func_dict = {
     "---------------OPS" : "#---------------------------------------------------#",
-    "ADD":         (0,   lambda x, y: x+y,                ('ss s'), "Add"),
-    "SUB":         (1,   lambda x, y: x-y,                ('ss s'), "Sub"),
-    "MUL":         (2,   lambda x, y: x*y,                ('ss s'), "Multiply"),
-    "DIV":         (3,   lambda x, y: x/y,                ('ss s'), "Divide"),
-    "INTDIV":      (4,   lambda x, y: x//y,               ('ss s'), "Int Division"),
+    "ADD":         (0,   operator.add,                    ('ss s'), "Add"),
+    "SUB":         (1,   operator.sub,                    ('ss s'), "Sub"),
+    "MUL":         (2,   operator.mul,                    ('ss s'), "Multiply"),
+    "DIV":         (3,   operator.truediv,                ('ss s'), "Divide"),
+    "INTDIV":      (4,   operator.floordiv,               ('ss s'), "Int Division"),
     "SQRT":        (10,  lambda x: sqrt(fabs(x)),          ('s s'), "Squareroot"),
     "EXP":         (11,  exp,                              ('s s'), "Exponent"),
-    "POW":         (12,  lambda x, y: x**y,               ('ss s'), "Power y"),
+    "POW":         (12,  operator.pow,                    ('ss s'), "Power y"),
     "POW2":        (13,  lambda x: x*x,                    ('s s'), "Power 2"),
     "LN":          (14,  log,                              ('s s'), "log"),
     "LOG10":       (20,  log10,                            ('s s'), "log10"),
     "LOG1P":       (21,  log1p,                            ('s s'), "log1p"),
     "ABS":         (30,  fabs,                             ('s s'), "Absolute"),
-    "NEG":         (31,  lambda x: -x,                     ('s s'), "Negate"),
+    "NEG":         (31,  operator.neg,                     ('s s'), "Negate"),
     "CEIL":        (32,  ceil,                             ('s s'), "Ceiling"),
     "FLOOR":       (33,  floor,                            ('s s'), "floor"),
     "MIN":         (40,  min,                             ('ss s'), "min"),
@@ -55,7 +57,7 @@ func_dict = {
     "ROUND":       (50,  round,                            ('s s'), "Round"),
     "ROUND-N":     (51,  lambda x, y: round(x, int(y)),   ('ss s'), "Round N",),
     "FMOD":        (52,  fmod,                            ('ss s'), "Fmod"),
-    "MODULO":      (53,  lambda x, y: (x % y),            ('ss s'), "modulo"),
+    "MODULO":      (53,  operator.mod,                    ('ss s'), "modulo"),
     "MEAN":        (54,  lambda x, y: 0.5*(x + y),        ('ss s'), "mean"),
     "GCD":         (55,  gcd,                             ('ss s'), "gcd"),
     "--------------TRIG" : "#-------------------------------------------------#",
@@ -92,6 +94,19 @@ func_dict = {
     "THETA TAU":   (140, lambda x: pi * 2 * ((x-1) / x),   ('s s'), "tau * (x-1 / x)")
 }
 
+# vectorized versions of functions which give bit identical results to their scalar counterparts,
+# the node is kept only for loading old files so its results must not change
+numpy_func_dict = {
+    "ADD":         np.add,
+    "SUB":         np.subtract,
+    "MUL":         np.multiply,
+    "MEAN":        lambda x, y: 0.5*(x + y),
+    "SQRT":        lambda x: np.sqrt(np.fabs(x)),
+    "ABS":         np.fabs,
+    "DEGREES":     np.degrees,
+    "RADIANS":     np.radians,
+}
+
 def func_from_mode(mode):
     return func_dict[mode][1]
 
@@ -223,9 +238,9 @@ class SvScalarMathNodeMK3(bpy.types.Node, SverchCustomTreeNode):
             result = []
             current_func = func_from_mode(self.current_op)
             if signature == (1, 1):
-                result = recurse_fx(x, current_func)
+                result = recurse_fx(x, current_func, numpy_func_dict.get(self.current_op))
             elif signature == (2, 1):
-                result = recurse_fxy(x, y, current_func)
+                result = recurse_fxy(x, y, current_func, numpy_func_dict.get(self.current_op))
             elif signature == (1, 2):
                 # special case at the moment
                 result = recurse_fx(x, sin)
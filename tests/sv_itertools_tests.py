@@ -0,0 +1,119 @@
+import math
+import operator
+
+import numpy as np
+
+from sverchok.utils.testing import *
+from sverchok.utils.sv_itertools import recurse_fx, recurse_fxy
+
+class RecurseFxyTests(SverchokTestCase):
+    def test_int_add_no_overflow(self):
+        l = [2**62, 2**62]
+        output = recurse_fxy(l, l, operator.add, np.add)
+        self.assertEquals(output, [2**63, 2**63])
+
+    def test_int_mul_no_overflow(self):
+        output = recurse_fxy([10**10], [10**10], operator.mul, np.multiply)
+        self.assertEquals(output, [10**20])
+
+    def test_int_result_type(self):
+        output = recurse_fxy([1, 2, 3], [4, 5, 6], operator.add, np.add)
+        self.assertEquals(output, [5, 7, 9])
+        self.assertTrue(all(isinstance(i, int) for i in output))
+
+    def test_list_of_arrays(self):
+        a = np.array([1.0, 2.0, 3.0])
+        output = recurse_fxy([a, a], [a, a], operator.add, np.add)
+        self.assertEquals(len(output), 2)
+        for item in output:
+            self.assertIsInstance(item, np.ndarray)
+            self.assert_numpy_arrays_equal(item, np.array([2.0, 4.0, 6.0]))
+
+    def test_flat_lists_of_different_length(self):
+        output = recurse_fxy([1.0, 2.0, 3.0, 4.0], [10.0, 20.0], operator.add, np.add)
+        self.assertEquals(output, [11.0, 22.0, 23.0, 24.0])
+
+    def test_ragged_lists(self):
+        l1 = [[1.0, 2.0], [3.0, 4.0, 5.0]]
+        l2 = [[1.0], [1.0, 2.0, 3.0, 4.0]]
+        expected_output = recurse_fxy(l1, l2, operator.add)
+        output = recurse_fxy(l1, l2, operator.add, np.add)
+        self.assertEquals(output, expected_output)
+        self.assertEquals(output, [[2.0, 3.0], [4.0, 6.0, 8.0, 9.0]])
+
+    def test_axes_of_length_one(self):
+        output = recurse_fxy([[1.0, 2.0], [3.0, 4.0]], [[5.0]], operator.add, np.add)
+        self.assertEquals(output, [[6.0, 7.0], [8.0, 9.0]])
+
+    def test_list_and_number(self):
+        output = recurse_fxy([[1.0, 2.0], [3.0, 4.0]], 2, operator.mul, np.multiply)
+        self.assertEquals(output, [[2.0, 4.0], [6.0, 8.0]])
+        output = recurse_fxy(2.0, [1.0, 2.0], operator.sub, np.subtract)
+        self.assertEquals(output, [1.0, 0.0])
+
+    def test_top_level_array(self):
+        a = np.array([1.0, 2.0, 3.0])
+        output = recurse_fxy(a, [1.0, 2.0], operator.add, np.add)
+        self.assertEquals(len(output), 2)
+        self.assert_numpy_arrays_equal(output[0], np.array([2.0, 3.0, 4.0]))
+        self.assert_numpy_arrays_equal(output[1], np.array([3.0, 4.0, 5.0]))
+
+    def test_deep_array(self):
+        l = [[[1.0, 2.0]], [np.array([3.0, 4.0])]]
+        output = recurse_fxy(l, l, operator.add, np.add)
+        self.assertEquals(output[0], [[2.0, 4.0]])
+        self.assertIsInstance(output[1][0], np.ndarray)
+        self.assert_numpy_arrays_equal(output[1][0], np.array([6.0, 8.0]))
+
+    def test_int_pairs_are_exact(self):
+        output = recurse_fxy([2**40, 0.5], [2**40, 2], operator.mul, np.multiply)
+        self.assertEquals(output, [2**80, 1.0])
+        self.assertIsInstance(output[0], int)
+
+    def test_empty_lists(self):
+        # empty data is left to the Python path, so the outcome is the same with and without f_numpy
+        for l1, l2 in [([], []), ([], [1.0]), ([[]], [[]])]:
+            with self.subTest(l1=l1, l2=l2):
+                try:
+                    expected_output = recurse_fxy(l1, l2, operator.add)
+                except IndexError:
+                    with self.assertRaises(IndexError):
+                        recurse_fxy(l1, l2, operator.add, np.add)
+                else:
+                    self.assertEquals(recurse_fxy(l1, l2, operator.add, np.add), expected_output)
+
+class RecurseFxTests(SverchokTestCase):
+    def test_rectangular_list(self):
+        data = [(0.0, 1.0, 2.0), (3.0, 4.0, 5.0)]
+        expected_output = recurse_fx(data, math.sin)
+        output = recurse_fx(data, math.sin, np.sin)
+        self.assert_sverchok_data_equal(output, expected_output, precision=12)
+        self.assertIsInstance(output[0], list)
+
+    def test_ragged_list(self):
+        data = [[0.0], [1.0, 2.0]]
+        output = recurse_fx(data, math.sin, np.sin)
+        self.assertEquals(output, [[math.sin(0.0)], [math.sin(1.0), math.sin(2.0)]])
+
+    def test_int_input(self):
+        output = recurse_fx([1, 4, 9], math.sqrt, np.sqrt)
+        self.assertEquals(output, [1.0, 2.0, 3.0])
+
+    def test_empty_list(self):
+        self.assertEquals(recurse_fx([], math.sin, np.sin), [])
+        self.assertEquals(recurse_fx([[]], math.sin, np.sin), [[]])
+
+    def test_list_of_arrays(self):
+        a = np.array([0.0, 1.0])
+        output = recurse_fx([a, a], np.sin, np.sin)
+        self.assertEquals(len(output), 2)
+        for item in output:
+            self.assertIsInstance(item, np.ndarray)
+            self.assert_numpy_arrays_equal(item, np.sin(a))
+
+    def test_deep_array(self):
+        a = np.array([3.0, 4.0])
+        output = recurse_fx([[[1.0, 2.0]], [a]], np.sin, np.sin)
+        self.assertEquals(output[0], [[math.sin(1.0), math.sin(2.0)]])
+        self.assertIsInstance(output[1][0], np.ndarray)
+        self.assert_numpy_arrays_equal(output[1][0], np.sin(a))
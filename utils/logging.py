@@ -21,6 +21,10 @@ internal_buffer_initialized = False
 file_initialized = False
 # Whether logging is initialized
 initialized = False
+# Current log level, it is updated by setLevel to avoid reading preferences on each logging call
+current_level = None
+
+log_level_rates = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "EXCEPTION": 50}
 
 
 @contextmanager
@@ -236,8 +240,11 @@ def setLevel(level):
     """
     Set logging level for all handlers.
     """
+    global current_level
+
     if type(level) != int:
         level = getattr(logging, level)
+    current_level = level
 
     logging.getLogger().setLevel(level)
     for handler in logging.getLogger().handlers:
@@ -246,11 +253,12 @@ def setLevel(level):
 
 def is_enabled_for(log_level="DEBUG") -> bool:
     """This check should be used for improving performance of calling disabled loggers"""
-    rates = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "EXCEPTION": 50}
-    addon = bpy.context.preferences.addons.get(sverchok.__name__)
-    current_level = rates.get(addon.preferences.log_level, 0)
-    given_level = rates.get(log_level, 0)
-    return given_level >= current_level
+    global current_level
+
+    if current_level is None:
+        addon = bpy.context.preferences.addons.get(sverchok.__name__)
+        current_level = log_level_rates.get(addon.preferences.log_level, 0)
+    return log_level_rates.get(log_level, 0) >= current_level
 
 
 consoleHandler = None
@@ -259,9 +267,11 @@ logger = logging.getLogger("logging")
 
 def register():
     global consoleHandler
+    global current_level
 
     with sv_preferences() as prefs:
         level = getattr(logging, prefs.log_level)
+        current_level = level
         logging.basicConfig(level=level, format=log_format)
         # Remember the first handler. We may need it in future
         # to remove from list.
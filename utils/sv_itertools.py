@@ -1,4 +1,6 @@
 from itertools import chain, repeat, zip_longest
+import warnings
+import numpy as np
 from sverchok.data_structure import levels_of_list_or_np, list_match_func
 
 # the class based should be slower but kept until tested
@@ -53,18 +55,106 @@ def sv_zip_longest2(*args):
         yield tuple((next(iterator, args[idx][-1]) for idx, iterator in enumerate(itrs)))
 
 
-def recurse_fx(l, f):
+def leaf_types(l):
+    '''returns types of items on the deepest level of a rectangular nested list,
+        the walk stops on a level which has items other than lists and tuples (e.g. NumPy arrays)'''
+    if not isinstance(l, (list, tuple)):
+        return {type(l)}
+    level = l
+    while True:
+        types = set(map(type, level))
+        if not types or not all(issubclass(t, (list, tuple)) for t in types):
+            return types
+        level = list(chain.from_iterable(level))
+
+def has_numpy_arrays(types):
+    return any(issubclass(t, np.ndarray) for t in types)
+
+def has_ints(types):
+    return any(issubclass(t, (int, np.integer)) for t in types)
+
+def as_numeric_array(l):
+    '''converts rectangular list of numbers into array, returns None for ragged lists
+        and lists which can't be converted into array of numbers'''
+    try:
+        with warnings.catch_warnings():
+            # NumPy before 1.24 makes object arrays from ragged lists with VisibleDeprecationWarning
+            warnings.simplefilter('ignore')
+            a = np.asarray(l)
+    except ValueError:  # ragged lists in NumPy 1.24 and newer
+        return None
+    if a.dtype.kind not in 'if':
+        return None
+    return a
+
+def numpy_fx(l, f_numpy):
+    '''applies f_numpy to a rectangular list of numbers converted into float64 array
+        returns None if the data can't be converted into such array or if it contains NumPy arrays'''
+    a = as_numeric_array(l)
+    if a is None or a.size == 0 or has_numpy_arrays(leaf_types(l)):
+        return None
+    with np.errstate(all='ignore'):  # as Python floats give inf and nan silently
+        return f_numpy(a.astype(np.float64, copy=False)).tolist()
+
+def recurse_fx(l, f, f_numpy=None):
+    '''applies f to every number of the nested list l
+        f_numpy (optional) is a vectorized version of f, it is applied at once
+        if l is a rectangular list of numbers, otherwise f is applied number by number'''
     if isinstance(l, (list, tuple)):
+        if f_numpy is not None:
+            res = numpy_fx(l, f_numpy)
+            if res is not None:
+                return res
         return [recurse_fx(i, f) for i in l]
     else:
         return f(l)
 
-def recurse_fxy(l1, l2, f):
+def numpy_fxy(l1, l2, f_numpy):
+    '''applies f_numpy to two arrays of the same shape (up to axes of length one) or to an array and a number,
+        flat arrays of different length are matched by repeating last item of the shorter one
+        returns None if the data can't be converted into such arrays, if it contains NumPy arrays
+        or if both arguments contain ints (NumPy integers overflow and int pairs in float arrays
+        are rounded unlike Python ints), so the result is the same as of the Python path'''
+    if isinstance(l1, np.ndarray) or isinstance(l2, np.ndarray):
+        return None
+    a = as_numeric_array(l1)
+    if a is None:
+        return None
+    b = as_numeric_array(l2)
+    if b is None or a.size == 0 or b.size == 0:
+        return None
+    if a.ndim == 1 and b.ndim == 1 and a.size != b.size:
+        n = max(a.size, b.size)
+        a = np.pad(a, (0, n - a.size), mode='edge')
+        b = np.pad(b, (0, n - b.size), mode='edge')
+    elif a.ndim and b.ndim and a.shape != b.shape:
+        # axes of length one are repeated by NumPy broadcasting the same way as by zip_longest
+        if a.ndim != b.ndim:
+            return None
+        if any(m != n and m != 1 and n != 1 for m, n in zip(a.shape, b.shape)):
+            return None
+    types1, types2 = leaf_types(l1), leaf_types(l2)
+    if has_numpy_arrays(types1) or has_numpy_arrays(types2):
+        return None
+    if has_ints(types1) and has_ints(types2):
+        return None
+    with np.errstate(all='ignore'):  # as Python floats give inf and nan silently
+        return f_numpy(a, b).tolist()
+
+def recurse_fxy(l1, l2, f, f_numpy=None):
+    '''applies f to every pair of numbers of the nested lists l1 and l2
+        f_numpy (optional) is a vectorized version of f, it is applied at once
+        if the lists can be converted into arrays (see numpy_fxy),
+        otherwise f is applied number by number'''
     l1_type = isinstance(l1, (list, tuple))
     l2_type = isinstance(l2, (list, tuple))
     if not (l1_type or l2_type):
         return f(l1, l2)
-    elif l1_type and l2_type:
+    if f_numpy is not None:
+        res = numpy_fxy(l1, l2, f_numpy)
+        if res is not None:
+            return res
+    if l1_type and l2_type:
         fl = l2[-1] if len(l1) > len(l2) else l1[-1]
         res = []
         res_append = res.append